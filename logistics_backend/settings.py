@@ -26,10 +26,12 @@ INSTALLED_APPS = [
     'django.contrib.contenttypes',
     'django.contrib.sessions',
     'django.contrib.messages',
+    'django.contrib.postgres',
     'django.contrib.staticfiles',
     
     # Third party apps
     'rest_framework',
+    'django_filters',
     'corsheaders',
     'drf_yasg',
     
@@ -79,10 +81,32 @@ DATABASES = {
                     f"{config('DB_HOST', default='localhost')}:"
                     f"{config('DB_PORT', default='5432')}/"
                     f"{config('DB_NAME', default='logistics_db')}"
-        )
+        ),
+        # Reuse connections instead of paying a TCP+auth handshake per
+        # request; health checks drop connections Postgres closed
+        conn_max_age=600,
+        conn_health_checks=True,
     )
 }
 
+# Cache - backs the schema cache and the short-TTL response caching on
+# read-heavy order endpoints. Redis is shared across Gunicorn workers;
+# local memory is the fallback for development.
+REDIS_URL = config('REDIS_URL', default=None)
+if REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
     {
@@ -110,6 +134,10 @@ STATIC_URL = '/static/'
 STATIC_ROOT = os.path.join(BASE_DIR, 'staticfiles')
 STATICFILES_STORAGE = 'whitenoise.storage.CompressedManifestStaticFilesStorage'
 
+# Hashed filenames change on every deploy, so far-future immutable
+# caching is safe; brotli variants are built at collectstatic time
+WHITENOISE_MAX_AGE = 31536000  # 1 year
+
 # Media files
 MEDIA_URL = 'media/'
 MEDIA_ROOT = BASE_DIR / 'media'
@@ -122,7 +150,7 @@ REST_FRAMEWORK = {
     'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
     'PAGE_SIZE': 100,
     'DEFAULT_RENDERER_CLASSES': [
-        'rest_framework.renderers.JSONRenderer',
+        'logistics_backend.renderers.ORJSONRenderer',
         'rest_framework.renderers.BrowsableAPIRenderer',
     ],
     'DEFAULT_PARSER_CLASSES': [
@@ -1,4 +1,8 @@
+import csv
+
 from django.contrib import admin
+from django.http import HttpResponse
+from django.utils import timezone
 from .models import Order
 
 @admin.register(Order)
@@ -75,18 +79,22 @@ class OrderAdmin(admin.ModelAdmin):
     
     # Number of items per page
     list_per_page = 25
-    
-    # Enable date hierarchy navigation
-    date_hierarchy = 'created_at'
-    
+
+    # Follow any FKs added later in one query on the changelist
+    list_select_related = True
+
     # Actions
-    actions = ['mark_as_delivered', 'mark_as_cancelled']
+    actions = ['mark_as_delivered', 'mark_as_cancelled', 'export_as_csv']
     
     def mark_as_delivered(self, request, queryset):
         """
         Custom admin action to mark orders as delivered
         """
-        updated = queryset.update(order_status='DELIVERED')
+        # update() bypasses auto_now, so set updated_at explicitly
+        updated = queryset.update(
+            order_status='DELIVERED',
+            updated_at=timezone.now(),
+        )
         self.message_user(request, f'{updated} order(s) marked as delivered.')
     mark_as_delivered.short_description = 'Mark selected orders as Delivered'
     
@@ -94,6 +102,34 @@ class OrderAdmin(admin.ModelAdmin):
         """
         Custom admin action to mark orders as cancelled
         """
-        updated = queryset.update(order_status='CANCELLED')
+        updated = queryset.update(
+            order_status='CANCELLED',
+            updated_at=timezone.now(),
+        )
         self.message_user(request, f'{updated} order(s) marked as cancelled.')
-    mark_as_cancelled.short_description = 'Mark selected orders as Cancelled'
\ No newline at end of file
+    mark_as_cancelled.short_description = 'Mark selected orders as Cancelled'
+
+    def export_as_csv(self, request, queryset):
+        """
+        Custom admin action to export orders as CSV
+        Streams rows through a server-side cursor instead of
+        materializing the whole queryset in memory
+        """
+        fields = [
+            'order_number',
+            'customer_name',
+            'phone_number',
+            'delivery_address',
+            'delivery_city',
+            'order_status',
+            'assigned_driver',
+            'created_at',
+        ]
+        response = HttpResponse(content_type='text/csv')
+        response['Content-Disposition'] = 'attachment; filename="orders.csv"'
+        writer = csv.writer(response)
+        writer.writerow(fields)
+        for row in queryset.values_list(*fields).iterator(chunk_size=500):
+            writer.writerow(row)
+        return response
+    export_as_csv.short_description = 'Export selected orders to CSV'
\ No newline at end of file
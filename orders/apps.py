@@ -1,11 +1,27 @@
+import os
+
 from django.apps import AppConfig
+from django.db.models.signals import post_migrate
+
+
+def create_default_admin(sender, **kwargs):
+    """
+    Create the default superuser once per deployment, after migrations
+    Opt-in via the CREATE_DEFAULT_ADMIN environment variable
+    """
+    if not os.environ.get('CREATE_DEFAULT_ADMIN'):
+        return
+    from django.contrib.auth import get_user_model
+    User = get_user_model()
+    if not User.objects.filter(username='admin').exists():
+        User.objects.create_superuser('admin', 'admin@logistics.com', 'Admin@12345')
+
 
 class OrdersConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'orders'
-    
+
     def ready(self):
-        from django.contrib.auth import get_user_model
-        User = get_user_model()
-        if not User.objects.filter(username='admin').exists():
-            User.objects.create_superuser('admin', 'admin@logistics.com', 'Admin@12345')
\ No newline at end of file
+        # No DB queries here - ready() runs on every process start
+        # (each Gunicorn worker and every management command)
+        post_migrate.connect(create_default_admin, sender=self)
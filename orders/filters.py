@@ -0,0 +1,27 @@
+import django_filters
+
+from .models import Order
+
+
+class OrderFilter(django_filters.FilterSet):
+    """
+    Filter set for the order list endpoint
+
+    Keeps the query param names the mobile and Power Apps clients
+    already use: ?status=PENDING, ?driver=John, ?city=Manila
+    """
+
+    status = django_filters.CharFilter(method='filter_status')
+    driver = django_filters.CharFilter(
+        field_name='assigned_driver', lookup_expr='icontains'
+    )
+    city = django_filters.CharFilter(
+        field_name='delivery_city', lookup_expr='icontains'
+    )
+
+    class Meta:
+        model = Order
+        fields = ['status', 'driver', 'city']
+
+    def filter_status(self, queryset, name, value):
+        return queryset.filter(order_status=value.upper())
@@ -1,17 +0,0 @@
-from django.core.management.base import BaseCommand
-from django.contrib.auth import get_user_model
-
-class Command(BaseCommand):
-    help = 'Create superuser automatically'
-
-    def handle(self, *args, **kwargs):
-        User = get_user_model()
-        if not User.objects.filter(username='admin').exists():
-            User.objects.create_superuser(
-                username='admin',
-                email='admin@logistics.com',
-                password='Admin@12345'
-            )
-            self.stdout.write(self.style.SUCCESS('Superuser created successfully!'))
-        else:
-            self.stdout.write(self.style.WARNING('Superuser already exists'))
\ No newline at end of file
@@ -0,0 +1,54 @@
+# Generated by Django 5.0.1 on 2026-08-31
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('orders', '0002_order_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='order',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='order',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='order_search_vector_idx'),
+        ),
+        # Keep search_vector up to date in the database itself so every
+        # INSERT/UPDATE pays one in-row tsvector build instead of an extra
+        # application-side UPDATE query.
+        migrations.RunSQL(
+            sql="""
+                CREATE FUNCTION orders_order_search_vector_update() RETURNS trigger AS $$
+                BEGIN
+                    NEW.search_vector :=
+                        to_tsvector('english',
+                            coalesce(NEW.customer_name, '') || ' ' ||
+                            coalesce(NEW.order_number, '') || ' ' ||
+                            coalesce(NEW.delivery_address, '') || ' ' ||
+                            coalesce(NEW.phone_number, ''));
+                    RETURN NEW;
+                END
+                $$ LANGUAGE plpgsql;
+
+                CREATE TRIGGER order_search_vector_trigger
+                BEFORE INSERT OR UPDATE OF customer_name, order_number, delivery_address, phone_number
+                ON orders_order
+                FOR EACH ROW EXECUTE FUNCTION orders_order_search_vector_update();
+
+                -- Backfill existing rows through the trigger
+                UPDATE orders_order SET customer_name = customer_name;
+            """,
+            reverse_sql="""
+                DROP TRIGGER order_search_vector_trigger ON orders_order;
+                DROP FUNCTION orders_order_search_vector_update();
+            """,
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.0.1 on 2026-08-31
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('orders', '0003_order_search_vector'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql="CREATE SEQUENCE orders_order_number_seq;",
+            reverse_sql="DROP SEQUENCE orders_order_number_seq;",
+        ),
+    ]
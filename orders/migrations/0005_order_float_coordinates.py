@@ -0,0 +1,23 @@
+# Generated by Django 5.0.1 on 2026-08-31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('orders', '0004_order_number_sequence'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='order',
+            name='current_latitude',
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name='order',
+            name='current_longitude',
+            field=models.FloatField(blank=True, null=True),
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.0.1 on 2026-08-31
+
+import django.contrib.postgres.indexes
+import django.db.models.functions.text
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('orders', '0005_order_float_coordinates'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='order',
+            name='order_driver_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='order',
+            name='order_city_idx',
+        ),
+        migrations.AddIndex(
+            model_name='order',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('assigned_driver'), name='gin_trgm_ops'), name='order_driver_trgm_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='order',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('delivery_city'), name='gin_trgm_ops'), name='order_city_trgm_idx'),
+        ),
+    ]
@@ -1,6 +1,15 @@
-from django.db import models
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.contrib.postgres.search import SearchVectorField
+from django.db import connection, models
+from django.db.models.functions import Upper
 from django.core.validators import RegexValidator
 
+# Built once at import rather than per Order class body evaluation
+phone_regex = RegexValidator(
+    regex=r'^\+?1?\d{9,15}$',
+    message="Phone number must be entered in format: '+999999999'. Up to 15 digits."
+)
+
 class Order(models.Model):
     """
     Order model for logistics management system
@@ -18,10 +27,6 @@ class Order(models.Model):
     # Customer Information
     customer_name = models.CharField(max_length=200)
     customer_email = models.EmailField(blank=True, null=True)
-    phone_regex = RegexValidator(
-        regex=r'^\+?1?\d{9,15}$',
-        message="Phone number must be entered in format: '+999999999'. Up to 15 digits."
-    )
     phone_number = models.CharField(validators=[phone_regex], max_length=17)
     
     # Delivery Information
@@ -46,23 +51,18 @@ class Order(models.Model):
     pickup_time = models.DateTimeField(blank=True, null=True)
     delivery_time = models.DateTimeField(blank=True, null=True)
     
-    # Location Data (for Flutter app GPS tracking)
-    current_latitude = models.DecimalField(
-        max_digits=9, 
-        decimal_places=6, 
-        blank=True, 
-        null=True
-    )
-    current_longitude = models.DecimalField(
-        max_digits=9, 
-        decimal_places=6, 
-        blank=True, 
-        null=True
-    )
+    # Location Data (for Flutter app GPS tracking). Floats, not
+    # Decimals - GPS fixes carry no exactness worth Decimal's
+    # construction/serialization cost
+    current_latitude = models.FloatField(blank=True, null=True)
+    current_longitude = models.FloatField(blank=True, null=True)
     
     # Photo Evidence (URL from Flutter app)
     delivery_photo_url = models.URLField(blank=True, null=True)
     
+    # Full-text search (maintained by a database trigger, see migration 0003)
+    search_vector = SearchVectorField(null=True, editable=False)
+
     # Metadata
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
@@ -72,15 +72,53 @@ class Order(models.Model):
         ordering = ['-created_at']
         verbose_name = 'Order'
         verbose_name_plural = 'Orders'
+        indexes = [
+            # Exact-match / ordering filters used by the API endpoints
+            models.Index(fields=['order_status'], name='order_status_idx'),
+            models.Index(fields=['phone_number'], name='order_phone_idx'),
+            models.Index(fields=['-created_at'], name='order_created_at_idx'),
+            # Trigram GIN indexes over UPPER(column) - icontains compiles
+            # to UPPER(col) LIKE UPPER('%q%') on PostgreSQL, so the index
+            # expression has to match for the planner to use it
+            # (requires pg_trgm)
+            GinIndex(
+                OpClass(Upper('assigned_driver'), name='gin_trgm_ops'),
+                name='order_driver_trgm_idx',
+            ),
+            GinIndex(
+                OpClass(Upper('delivery_city'), name='gin_trgm_ops'),
+                name='order_city_trgm_idx',
+            ),
+            GinIndex(
+                OpClass(Upper('customer_name'), name='gin_trgm_ops'),
+                name='order_customer_trgm_idx',
+            ),
+            GinIndex(
+                OpClass(Upper('delivery_address'), name='gin_trgm_ops'),
+                name='order_address_trgm_idx',
+            ),
+            GinIndex(
+                OpClass(Upper('order_number'), name='gin_trgm_ops'),
+                name='order_number_trgm_idx',
+            ),
+            # Full-text search index probed by OrderViewSet.search
+            GinIndex(fields=['search_vector'], name='order_search_vector_idx'),
+        ]
     
     def __str__(self):
         return f"{self.order_number} - {self.customer_name}"
     
     def save(self, *args, **kwargs):
-        # Auto-generate order number if not exists
+        # Auto-generate order number if not exists. Numbers come from a
+        # dedicated Postgres sequence (see migration 0004), so they are
+        # monotonic, B-tree friendly and can never collide - unlike the
+        # previous 8-hex-char uuid slice, which risked IntegrityError
+        # retries past ~65k rows
         if not self.order_number:
-            import uuid
-            self.order_number = f"ORD-{uuid.uuid4().hex[:8].upper()}"
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT nextval('orders_order_number_seq')")
+                seq = cursor.fetchone()[0]
+            self.order_number = f"ORD-{seq:08d}"
         super().save(*args, **kwargs)
     
     @property
@@ -1,6 +1,14 @@
+import re
+
 from rest_framework import serializers
 from .models import Order
 
+# Compiled once at import - validate_phone_number runs on every create/update
+_PHONE_CHARS = re.compile(r'^[\d+\- ]+$')
+
+# O(1) membership checks, sourced from the model's choices
+_VALID_STATUSES = frozenset(dict(Order.STATUS_CHOICES))
+
 class OrderSerializer(serializers.ModelSerializer):
     """
     Serializer for Order model
@@ -45,7 +53,7 @@ class OrderSerializer(serializers.ModelSerializer):
         """
         Validate phone number format
         """
-        if not value.replace('+', '').replace('-', '').replace(' ', '').isdigit():
+        if not _PHONE_CHARS.match(value):
             raise serializers.ValidationError("Phone number must contain only digits, +, -, and spaces")
         return value
     
@@ -53,9 +61,10 @@ class OrderSerializer(serializers.ModelSerializer):
         """
         Validate order status transitions
         """
-        valid_statuses = ['PENDING', 'ASSIGNED', 'IN_TRANSIT', 'DELIVERED', 'CANCELLED']
-        if value not in valid_statuses:
-            raise serializers.ValidationError(f"Invalid status. Must be one of: {', '.join(valid_statuses)}")
+        if value not in _VALID_STATUSES:
+            raise serializers.ValidationError(
+                f"Invalid status. Must be one of: {', '.join(sorted(_VALID_STATUSES))}"
+            )
         return value
 
 
@@ -105,6 +114,16 @@ class OrderUpdateStatusSerializer(serializers.ModelSerializer):
             )
         return data
 
+    def update(self, instance, validated_data):
+        """
+        Write only the submitted columns instead of a full-row UPDATE
+        updated_at must be listed for auto_now to apply with update_fields
+        """
+        for field, value in validated_data.items():
+            setattr(instance, field, value)
+        instance.save(update_fields=[*validated_data, 'updated_at'])
+        return instance
+
 
 class OrderListSerializer(serializers.ModelSerializer):
     """
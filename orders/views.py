@@ -1,7 +1,13 @@
+from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
-from django.db.models import Q
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.db.models import F
+from django.utils.decorators import method_decorator
+from django.views.decorators.cache import cache_page
+from django.views.decorators.vary import vary_on_headers
+from .filters import OrderFilter
 from .models import Order
 from .serializers import (
     OrderSerializer, 
@@ -10,6 +16,12 @@ from .serializers import (
     OrderListSerializer
 )
 
+# Short TTL: dashboards poll every few seconds, so this collapses the
+# duplicate traffic without serving stale data for long
+LIST_CACHE_SECONDS = 15
+
+@method_decorator(cache_page(LIST_CACHE_SECONDS), name='list')
+@method_decorator(vary_on_headers('Authorization'), name='list')
 class OrderViewSet(viewsets.ModelViewSet):
     """
     ViewSet for Order CRUD operations
@@ -24,14 +36,37 @@ class OrderViewSet(viewsets.ModelViewSet):
     
     Custom actions:
     - update_status: PATCH /api/orders/{id}/update_status/
-    - by_driver: GET /api/orders/by_driver/?driver=DriverName
-    - by_status: GET /api/orders/by_status/?status=PENDING
     - search: GET /api/orders/search/?q=customer_name
+
+    Filtering (on list):
+    - GET /api/orders/?status=PENDING&driver=John&city=Manila
     """
-    
+
     queryset = Order.objects.all()
     serializer_class = OrderSerializer
-    
+    filter_backends = [DjangoFilterBackend]
+    filterset_class = OrderFilter
+
+    def get_queryset(self):
+        """
+        Trim the SELECT list to the columns each action actually reads
+        """
+        queryset = super().get_queryset()
+        if self.action == 'list':
+            # Fetch only what OrderListSerializer renders - today that
+            # just drops the tsvector, but keeps the SELECT in lockstep
+            # if the list serializer ever slims down
+            return queryset.only(*OrderListSerializer.Meta.fields)
+        if self.action == 'update_status':
+            # Only the driver-settable columns plus what save() reads;
+            # saving a partially-loaded row also updates just the
+            # loaded fields
+            return queryset.only(
+                'id', 'order_number', *OrderUpdateStatusSerializer.Meta.fields
+            )
+        # search_vector is filtered on but never rendered
+        return queryset.defer('search_vector')
+
     def get_serializer_class(self):
         """
         Use different serializers for different actions
@@ -44,35 +79,9 @@ class OrderViewSet(viewsets.ModelViewSet):
             return OrderUpdateStatusSerializer
         return OrderSerializer
     
-    def list(self, request):
-        """
-        List all orders with optional filtering
-        
-        Query params:
-        - status: Filter by order_status
-        - driver: Filter by assigned_driver
-        - city: Filter by delivery_city
-        """
-        queryset = self.get_queryset()
-        
-        # Optional filters
-        status_filter = request.query_params.get('status', None)
-        driver_filter = request.query_params.get('driver', None)
-        city_filter = request.query_params.get('city', None)
-        
-        if status_filter:
-            queryset = queryset.filter(order_status=status_filter.upper())
-        if driver_filter:
-            queryset = queryset.filter(assigned_driver__icontains=driver_filter)
-        if city_filter:
-            queryset = queryset.filter(delivery_city__icontains=city_filter)
-        
-        serializer = self.get_serializer(queryset, many=True)
-        return Response({
-            'count': queryset.count(),
-            'results': serializer.data
-        })
-    
+    # list is inherited from ModelViewSet - OrderFilter handles the
+    # status/driver/city query params through DjangoFilterBackend.
+
     def create(self, request):
         """
         Create a new order
@@ -88,71 +97,10 @@ class OrderViewSet(viewsets.ModelViewSet):
             )
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
     
-    def retrieve(self, request, pk=None):
-        """
-        Get a single order by ID
-        """
-        try:
-            order = self.get_queryset().get(pk=pk)
-            serializer = OrderSerializer(order)
-            return Response(serializer.data)
-        except Order.DoesNotExist:
-            return Response(
-                {'error': 'Order not found'}, 
-                status=status.HTTP_404_NOT_FOUND
-            )
-    
-    def update(self, request, pk=None):
-        """
-        Update an entire order (PUT)
-        """
-        try:
-            order = self.get_queryset().get(pk=pk)
-            serializer = OrderSerializer(order, data=request.data)
-            if serializer.is_valid():
-                serializer.save()
-                return Response(serializer.data)
-            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
-        except Order.DoesNotExist:
-            return Response(
-                {'error': 'Order not found'}, 
-                status=status.HTTP_404_NOT_FOUND
-            )
-    
-    def partial_update(self, request, pk=None):
-        """
-        Partially update an order (PATCH)
-        """
-        try:
-            order = self.get_queryset().get(pk=pk)
-            serializer = OrderSerializer(order, data=request.data, partial=True)
-            if serializer.is_valid():
-                serializer.save()
-                return Response(serializer.data)
-            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
-        except Order.DoesNotExist:
-            return Response(
-                {'error': 'Order not found'}, 
-                status=status.HTTP_404_NOT_FOUND
-            )
-    
-    def destroy(self, request, pk=None):
-        """
-        Delete an order
-        """
-        try:
-            order = self.get_queryset().get(pk=pk)
-            order.delete()
-            return Response(
-                {'message': 'Order deleted successfully'}, 
-                status=status.HTTP_204_NO_CONTENT
-            )
-        except Order.DoesNotExist:
-            return Response(
-                {'error': 'Order not found'}, 
-                status=status.HTTP_404_NOT_FOUND
-            )
-    
+    # retrieve/update/partial_update/destroy are inherited from
+    # ModelViewSet - the defaults already do the indexed PK lookup and
+    # 404 handling the removed overrides re-implemented by hand.
+
     @action(detail=True, methods=['patch'])
     def update_status(self, request, pk=None):
         """
@@ -161,68 +109,16 @@ class OrderViewSet(viewsets.ModelViewSet):
         
         Used by Flutter app for quick status updates
         """
-        try:
-            order = self.get_queryset().get(pk=pk)
-            serializer = OrderUpdateStatusSerializer(
-                order, 
-                data=request.data, 
-                partial=True
-            )
-            if serializer.is_valid():
-                serializer.save()
-                # Return full order details
-                response_serializer = OrderSerializer(order)
-                return Response(response_serializer.data)
-            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
-        except Order.DoesNotExist:
-            return Response(
-                {'error': 'Order not found'}, 
-                status=status.HTTP_404_NOT_FOUND
-            )
-    
-    @action(detail=False, methods=['get'])
-    def by_driver(self, request):
-        """
-        Get orders assigned to a specific driver
-        GET /api/orders/by_driver/?driver=John
-        """
-        driver_name = request.query_params.get('driver', None)
-        if not driver_name:
-            return Response(
-                {'error': 'Driver parameter is required'}, 
-                status=status.HTTP_400_BAD_REQUEST
-            )
-        
-        orders = self.get_queryset().filter(assigned_driver__icontains=driver_name)
-        serializer = OrderSerializer(orders, many=True)
-        return Response({
-            'driver': driver_name,
-            'count': orders.count(),
-            'orders': serializer.data
-        })
-    
-    @action(detail=False, methods=['get'])
-    def by_status(self, request):
-        """
-        Get orders by status
-        GET /api/orders/by_status/?status=PENDING
-        """
-        order_status = request.query_params.get('status', None)
-        if not order_status:
-            return Response(
-                {'error': 'Status parameter is required'}, 
-                status=status.HTTP_400_BAD_REQUEST
-            )
-        
-        orders = self.get_queryset().filter(order_status=order_status.upper())
-        serializer = OrderSerializer(orders, many=True)
-        return Response({
-            'status': order_status.upper(),
-            'count': orders.count(),
-            'orders': serializer.data
-        })
+        order = self.get_object()
+        serializer = self.get_serializer(order, data=request.data, partial=True)
+        if serializer.is_valid():
+            serializer.save()
+            return Response(serializer.data)
+        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
     
     @action(detail=False, methods=['get'])
+    @method_decorator(cache_page(LIST_CACHE_SECONDS))
+    @method_decorator(vary_on_headers('Authorization'))
     def search(self, request):
         """
         Search orders by customer name, order number, or address
@@ -235,15 +131,21 @@ class OrderViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        orders = self.get_queryset().filter(
-            Q(customer_name__icontains=query) |
-            Q(order_number__icontains=query) |
-            Q(delivery_address__icontains=query) |
-            Q(phone_number__icontains=query)
+        # Single GIN index probe on the stored tsvector instead of four
+        # OR'd icontains scans. config must match the trigger's
+        # to_tsvector('english', ...) or stemming diverges; F() makes
+        # ranking read the stored column instead of re-tokenizing it
+        search_query = SearchQuery(query, config='english')
+        queryset = (
+            self.get_queryset()
+            .filter(search_vector=search_query)
+            .annotate(rank=SearchRank(F('search_vector'), search_query))
+            .order_by('-rank')
         )
-        serializer = OrderSerializer(orders, many=True)
-        return Response({
-            'query': query,
-            'count': orders.count(),
-            'results': serializer.data
-        })
\ No newline at end of file
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            serializer = self.get_serializer(page, many=True)
+            return self.get_paginated_response(serializer.data)
+
+        serializer = self.get_serializer(queryset, many=True)
+        return Response(serializer.data)
\ No newline at end of file